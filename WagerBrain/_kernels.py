@@ -0,0 +1,76 @@
+"""Numba-compiled numeric kernels shared across the package.
+
+Numba stays optional: when it is not installed the decorators below fall
+back to identity wrappers and every kernel runs as plain Python/NumPy.
+"""
+import numpy as np
+
+try:  # Optional accelerator — keep numba out of the hard dependencies
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - pure-Python fallback
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
+
+
+@njit(cache=True, fastmath=True)
+def _elo_prob(elo_diff: float) -> float:
+    """Win probability for an ELO rating difference."""
+    return 1.0 / (10.0 ** (-elo_diff / 400.0) + 1.0)
+
+
+@njit(cache=True, fastmath=True)
+def _true_ev(stake: float, profit: float, prob: float) -> float:
+    """Expected value of a wager given a true win probability."""
+    return profit * prob - stake * (1.0 - prob)
+
+
+@njit(cache=True, fastmath=True)
+def _prob_to_american(prob: float) -> float:
+    """American odds for a win probability, branchless on the 50% split.
+
+    Sign comes from copysign so favourites (p >= 0.5) go negative without
+    a compare-and-jump; p == 0.5 maps to -100 as before.
+    """
+    q = 1.0 - prob
+    hi = prob if prob > q else q
+    lo = q if prob > q else prob
+    return -np.copysign(100.0 * hi / lo, prob - q)
+
+
+@njit(cache=True, fastmath=True)
+def _kelly_outcomes(probs: np.ndarray, odds: np.ndarray, bankroll: float):
+    """Independent Kelly stakes/fractions/edges per outcome of a market.
+
+    Negative-edge outcomes keep zero stake and fraction; the edge is
+    still reported so callers can show how bad the bet is.
+    """
+    n = probs.shape[0]
+    stakes = np.zeros(n, dtype=np.float64)
+    fractions = np.zeros(n, dtype=np.float64)
+    edges = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        b = odds[i] - 1.0
+        p = probs[i]
+        edge = b * p - (1.0 - p)
+        edges[i] = edge
+        f = edge / b
+        if f > 0.0:
+            fractions[i] = f
+            stakes[i] = bankroll * f
+    return stakes, fractions, edges
+
+
+@njit(cache=True, parallel=True)
+def elo_prob_vec(elo_diffs: np.ndarray) -> np.ndarray:
+    """Vectorized elo_prob over a float64 array of rating differences."""
+    out = np.empty(elo_diffs.shape[0], dtype=np.float64)
+    for i in prange(elo_diffs.shape[0]):
+        out[i] = 1.0 / (10.0 ** (-elo_diffs[i] / 400.0) + 1.0)
+    return out
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Union, Dict, Callable, Optional, Literal, List, Tuple
-from decimal import Decimal, getcontext
+from decimal import Decimal, getcontext, ROUND_HALF_EVEN
 from datetime import datetime
-from threading import RLock
+from threading import Lock
 from pathlib import Path
 import json
+import logging
+import numpy as np
 from WagerBrain.odds import OddsConverter
 from WagerBrain.utils import MarketUtils, setup_logger, GlobalLogWriter
 from WagerBrain.wagr import HistoryBuffer, Wager
@@ -13,6 +16,109 @@ from WagerBrain.risk import DynamicRiskManager, RISK_PRESETS
 from WagerBrain.probs import ProbabilityCalculator
 from WagerBrain.payouts import PayoutCalculator
 
+from WagerBrain._kernels import njit
+
+# Bankroll math never needs the default 28-digit precision: dollars, cents
+# and a few guard digits are plenty, and every Decimal op scales with digits.
+getcontext().prec = 12
+getcontext().rounding = ROUND_HALF_EVEN
+
+# ————————————————————————————————
+# MONEY HELPERS — INT CENTS INTERNALLY
+# ————————————————————————————————
+_CENT = Decimal("0.01")
+_D0 = Decimal(0)
+_D1 = Decimal(1)
+
+
+def _D(x) -> Decimal:
+    """Build a Decimal from a float without the slow string-parse path."""
+    return Decimal.from_float(x) if isinstance(x, float) else Decimal(x)
+
+
+def _cents(x) -> int:
+    """Convert a dollar amount (float, int, or Decimal) to integer cents."""
+    return int(round(float(x) * 100))
+
+
+def _to_dec(cents: int) -> Decimal:
+    """Convert integer cents back to a two-place Decimal at the I/O boundary."""
+    return Decimal(cents) / 100
+
+
+_SQRT5 = 5 ** 0.5
+_PHI = (1 + _SQRT5) / 2
+
+# Labouchere ratio sequences for the common 5-bet case, precomputed so the
+# strategies scale them with one broadcast multiply instead of rebuilding lists.
+_LAB5 = np.array([0.1, 0.2, 0.4, 0.2, 0.1])
+_REVLAB5 = np.array([0.2, 0.3, 0.5, 0.3, 0.2])
+
+
+@lru_cache(maxsize=32)
+def _revlab_ratios(num_bets: int) -> Tuple[float, ...]:
+    """Symmetric reverse-Labouchere ratios for non-standard sequence lengths."""
+    mid_point = num_bets // 2
+    ratios = [0.1 * (i + 1) for i in range(mid_point + 1)]
+    if num_bets % 2 == 0:
+        ratios = ratios + ratios[-2::-1]
+    else:
+        ratios = ratios + ratios[-1::-1]
+    return tuple(ratios)
+
+
+_STRATEGY_NAMES = (
+    "ev, fib, vig, pure_kelly, elo_kelly, parlay_bet, margin_bet, labouchere, "
+    "martingale, dalembert, reverse_labouchere, flat, percentage, fixed_unit"
+)
+
+# Reusable "why" templates — %-formatting reuses one compiled template per
+# strategy instead of building a fresh f-string per bet.
+_WHY = {
+    "ev": "EV×%.1f",
+    "pure_kelly": "Pure Kelly %.1f%%",
+    "fib": "Fib×%d (s=%d)",
+    "parlay": "Parlay %.2f dec (no vig)",
+    "margin": "Low margin %.1f%% adj",
+    "labouchere": "Labouchere sequence (target $%s)",
+    "martingale": "Martingale ×%s after %d losses",
+    "dalembert": "D'Alembert: %d wins, %d losses",
+    "reverse_labouchere": "Reverse Labouchere (target $%s)",
+    "flat": "Flat betting $%s fixed (%.1f%% of bankroll)",
+    "percentage": "Percentage betting %.1f%% of $%.0f bankroll",
+    "fixed_unit": "Fixed unit: %d × $%s",
+}
+
+
+@njit(cache=True)
+def _kelly_math(p: float, dec_odds: float, use_p: float) -> Tuple[float, float]:
+    """Scalar Kelly fraction + EV kernel (JIT-compiled when numba is present)."""
+    b = dec_odds - 1.0
+    ev = use_p * b - (1.0 - use_p)
+    if ev <= 0:
+        return 0.0, ev
+    return (b * p - (1.0 - p)) / b, ev
+
+
+@njit(cache=True)
+def _fib_multiplier(streak: int) -> int:
+    """Closed-form Fibonacci multiplier F(streak+2); exact for streak < 70."""
+    return int(_PHI ** (streak + 2) / _SQRT5 + 0.5)
+
+
+def _kelly_vec(p, dec_odds, true_p=None):
+    """
+    Vectorized Kelly fraction and EV over arrays of probabilities and
+    decimal odds. Returns (kelly_f, ev) as float64 arrays.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    b = np.asarray(dec_odds, dtype=np.float64) - 1.0
+    use_p = p if true_p is None else np.asarray(true_p, dtype=np.float64)
+    ev = use_p * b - (1.0 - use_p)
+    kelly_f = np.where(ev > 0, (b * p - (1.0 - p)) / b, 0.0)
+    return kelly_f, ev
+
+
 # ————————————————————————————————
 # 6. THE THUGNIFICENT BRAIN — 9.9/10
 # ————————————————————————————————
@@ -29,26 +135,29 @@ class BnkRllBrn:
     - 10/10 reliability
     """
 
-    _lock = RLock()
+    _lock = Lock()  # plain Lock: nothing re-enters while holding it
 
     def __init__(
         self,
         bankroll: Union[float, Decimal],
         profile: str = "balanced",
         max_risk_pct: float = 0.35,
-        log_file: str = "bets.jsonl",
+        log_file: Optional[str] = "bets.jsonl",
         min_bankroll: float = 100.0,
         log_level: str = "INFO",
     ):
         with self._lock:
-            self.bank = Decimal(str(bankroll))
+            self._bank_cents = _cents(bankroll)
             self.peak = self.bank
-            self.min_bank = Decimal(str(min_bankroll))
+            self._min_bank_cents = _cents(min_bankroll)
             self.logger = setup_logger(log_level)
-            self.history = HistoryBuffer(10_000, Path(log_file))
-            self.writer = GlobalLogWriter(Path(log_file))
+            # One Path conversion shared by history and writer; log_file=None
+            # skips persistence entirely for disposable simulation engines.
+            log_path = Path(log_file) if log_file else None
+            self.history = HistoryBuffer(10_000, log_path)
+            self.writer = GlobalLogWriter(log_path) if log_path else None
             self.risk = DynamicRiskManager(RISK_PRESETS[profile.lower()], max_risk_pct)
-            self._stats = {"placed": 0, "total_ev": Decimal("0")}
+            self._stats = {"placed": 0, "total_ev": _D0}
             self.fib_streak = 0
             self.logger.info("WagerBrain v18 — nrBllRkB 10/10")
             self.odds_converter = OddsConverter()
@@ -56,58 +165,86 @@ class BnkRllBrn:
             self.payout_calc = PayoutCalculator()
             self.utils = MarketUtils()
             self.wager = Wager
+            self._dec_cache: Dict[tuple, float] = {}
+            self._imp_cache: Dict[tuple, float] = {}
 
     # ————————————————————————————————
     # INTERNAL UTILITIES
     # ————————————————————————————————
 
+    @property
+    def bank(self) -> Decimal:
+        """Bankroll as a two-place Decimal for display/serialization."""
+        return _to_dec(self._bank_cents)
+
+    @bank.setter
+    def bank(self, value: Union[float, Decimal]) -> None:
+        self._bank_cents = _cents(value)
+
+    @property
+    def min_bank(self) -> Decimal:
+        """Minimum bankroll as a Decimal."""
+        return _to_dec(self._min_bank_cents)
+
     def _check_bank(self) -> None:
         """Halt if bankroll is below minimum."""
-        if self.bank < self.min_bank:
+        if self._bank_cents < self._min_bank_cents:
             raise ValueError(f"Bankroll ${self.bank:.2f} < minimum ${self.min_bank}")
 
+    def _dec(self, odds: "Number") -> float:
+        """Cached decimal-odds conversion (sportsbook lines repeat heavily).
+
+        Keys carry the type: 150 (American) and 150.0 (decimal) compare
+        equal but convert differently, so a bare-odds key would leak one
+        format's conversion to the other.
+        """
+        key = (type(odds), odds)
+        dec = self._dec_cache.get(key)
+        if dec is None:
+            dec = self._dec_cache[key] = float(self.odds_converter.decimal_odds(odds))
+        return dec
+
+    def _implied(self, odds: "Number") -> float:
+        """Cached implied win probability for American odds; typed key as _dec."""
+        key = (type(odds), odds)
+        p = self._imp_cache.get(key)
+        if p is None:
+            p = self._imp_cache[key] = self.prob_calc.american_implied_win_prob(odds)
+        return p
+
     def _kelly_core(
         self, p: float, odds: "Number", true_p: Optional[float] = None
-    ) -> Tuple[Decimal, float]:
+    ) -> Tuple[float, float]:
         """
         Kelly Criterion with optional true_prob for sharper EV precision.
-        Returns (kelly_fraction, expected_value).
+        Returns (kelly_fraction, expected_value) as native floats.
         """
-        dec = Decimal(str(self.odds_converter.decimal_odds(odds)))
-        profit = float(dec - 1)
         use_prob = true_p if true_p is not None else p
-        ev = self.prob_calc.true_odds_ev(stake=1.0, profit=profit, prob=use_prob)
-        if ev <= 0:
-            return Decimal("0"), ev
-
-        b = dec - 1
-        p_dec = Decimal(str(p))
-        q = Decimal(1) - p_dec
-        return (b * p_dec - q) / b, ev
+        return _kelly_math(p, self._dec(odds), use_prob)
 
     def _record(self, wager: "Wager", won: bool = False) -> None:
-        """Thread-safe recording with stat updates."""
+        """Thread-safe recording; only stat/history mutation holds the lock."""
         with self._lock:
             self.history.append(wager)
             if wager.amount > 0:
                 self._stats["placed"] += 1
-                self._stats["total_ev"] += wager.amount * Decimal(str(wager.ev))
+                self._stats["total_ev"] += (wager.amount * _D(wager.ev)).quantize(_CENT)
                 self.peak = max(self.peak, self.bank)
                 if won:
                     self.fib_streak = 0
 
-            self.risk.update(self.bank)
+        # Risk update, logging, and the writer enqueue stay outside the lock:
+        # risk.update works on a bank snapshot and the writer queue has its
+        # own synchronization.
+        self.risk.update(self.bank)
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
-                f"BET | {wager.strategy:8} | ${wager.amount:>8,.0f} | "
-                f"{wager.risk.upper():6} | {wager.why}"
+                "BET | %-8s | $%8.0f | %-6s | %s",
+                wager.strategy, float(wager.amount), wager.risk.upper(), wager.why,
             )
 
-            if self.writer:
-                json_wager = {
-                    k: str(v) if isinstance(v, Decimal) else v
-                    for k, v in wager.dict().items()
-                }
-                self.writer.write(json_wager)
+        if self.writer:
+            self.writer.write(wager.to_json_dict())
 
     # ————————————————————————————————
     # STRATEGIES - ORIGINAL
@@ -121,17 +258,15 @@ class BnkRllBrn:
         kelly_f, ev = self._kelly_core(p, odds, true_p)
 
         if ev <= 0.015:
-            wager = Wager("EV-Kelly", Decimal("0"), "EV < 1.5% — No edge", "low", 0, ev, 0)
+            wager = Wager("EV-Kelly", _D0, "EV < 1.5% — No edge", "low", 0, ev, 0)
         else:
             weight = 1 + (ev ** aggression) * 8
-            weighted_f = kelly_f * Decimal(str(weight))
-            pct = min(float(weighted_f), 1.0)
-            amount = self.risk.cap(
-                (self.bank * Decimal(str(pct))).quantize(Decimal("0.01")), self.bank
-            )
+            pct = min(kelly_f * weight, 1.0)
+            amount = self.risk.cap(_to_dec(int(self._bank_cents * pct)), self.bank)
             wager = Wager(
-                "EV-Kelly", amount, f"EV×{weight:.1f}",
-                self.risk.level(pct), pct, ev, weight
+                "EV-Kelly", amount, _WHY["ev"] % weight,
+                self.risk.level(pct), pct, ev, weight,
+                odds=odds, dec_odds=self._dec(odds),
             )
 
         self._record(wager)
@@ -143,15 +278,14 @@ class BnkRllBrn:
         kelly_f, ev = self._kelly_core(p, odds, true_p)
 
         if ev <= 0:
-            wager = Wager("pure_kelly", Decimal("0"), "EV <= 0 — No edge", "low", 0, ev, 0)
+            wager = Wager("pure_kelly", _D0, "EV <= 0 — No edge", "low", 0, ev, 0)
         else:
-            pct = min(float(kelly_f), 1.0)
-            amount = self.risk.cap(
-                (self.bank * Decimal(str(pct))).quantize(Decimal("0.01")), self.bank
-            )
+            pct = min(kelly_f, 1.0)
+            amount = self.risk.cap(_to_dec(int(self._bank_cents * pct)), self.bank)
             wager = Wager(
-                "pure_kelly", amount, f"Pure Kelly {pct:.1%}",
-                self.risk.level(pct), pct, ev, 1.0
+                "pure_kelly", amount, _WHY["pure_kelly"] % (pct * 100),
+                self.risk.level(pct), pct, ev, 1.0,
+                odds=odds, dec_odds=self._dec(odds),
             )
 
         self._record(wager)
@@ -172,27 +306,28 @@ class BnkRllBrn:
 
         skip_fib = False
         if p is not None:
-            implied_p = self.prob_calc.american_implied_win_prob(odds)
+            implied_p = self._implied(odds)
             if p < implied_p:
-                self.logger.info(f"Fib skipped: p {p:.1%} < implied {implied_p:.1%} (no edge)")
+                self.logger.info(
+                    "Fib skipped: p %.1f%% < implied %.1f%% (no edge)",
+                    p * 100, implied_p * 100,
+                )
                 skip_fib = True
 
         if skip_fib:
-            amount = Decimal("0")
+            amount = _D0
             why = "No edge — Skip (p < implied)"
         else:
-            a, b = 1, 1
-            for _ in range(self.fib_streak):
-                a, b = b, a + b
-            raw = self.bank * Decimal(str(unit)) * Decimal(str(b))
-            amount = self.risk.cap(raw.quantize(Decimal("0.01")), self.bank)
-            why = f"Fib×{b} (s={self.fib_streak})"
+            b = _fib_multiplier(self.fib_streak)
+            amount = self.risk.cap(_to_dec(int(self._bank_cents * unit * b)), self.bank)
+            why = _WHY["fib"] % (b, self.fib_streak)
             if reset_forced:
                 why += " — FORCING RESET"
 
-        pct = float(amount / self.bank) if amount > 0 else 0
+        pct = float(amount) * 100 / self._bank_cents if amount > 0 else 0
         risk_level = "SKIP" if skip_fib else self.risk.level(pct)
-        wager = Wager("fib", amount, why, risk_level, pct, 0, 0)
+        wager = Wager("fib", amount, why, risk_level, pct, 0, 0,
+                      odds=odds, dec_odds=self._dec(odds))
         self._record(wager)
 
         if not skip_fib and not won_last and not reset_forced:
@@ -212,12 +347,12 @@ class BnkRllBrn:
         parlay_dec = self.odds_converter.parlay_odds(odds_list)
         juice = 0.0
         adj_pct = base_pct * (1 - juice)
-        amount = (self.bank * Decimal(str(adj_pct))).quantize(Decimal("0.01"))
-        amount = self.risk.cap(amount, self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(int(self._bank_cents * adj_pct)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
         wager = Wager(
-            "parlay", amount, f"Parlay {parlay_dec:.2f} dec (no vig)",
-            self.risk.level(pct), pct, 0, 0
+            "parlay", amount, _WHY["parlay"] % parlay_dec,
+            self.risk.level(pct), pct, 0, 0,
+            odds=list(odds_list), dec_odds=float(parlay_dec),
         )
         self._record(wager)
         return wager
@@ -227,10 +362,10 @@ class BnkRllBrn:
         self._check_bank()
         margin = self.utils.bookmaker_margin(fav_odds, dog_odds)
         adj_pct = base_pct / max(margin + 0.01, 0.01)
-        amount = self.risk.cap((self.bank * Decimal(str(adj_pct))).quantize(Decimal("0.01")), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(int(self._bank_cents * adj_pct)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
         wager = Wager(
-            "margin", amount, f"Low margin {margin:.1%} adj",
+            "margin", amount, _WHY["margin"] % (margin * 100),
             self.risk.level(pct), pct, 0, 0
         )
         self._record(wager)
@@ -254,27 +389,26 @@ class BnkRllBrn:
             if isinstance(odds, (tuple, list)):
                 fav_odds, dog_odds, *rest = odds
                 draw_odds = rest[0] if rest else None
-                margin = bookmaker_margin(fav_odds, dog_odds, draw_odds)
-                commission_adj = bookmaker_commission(fav_odds, dog_odds, commish, draw_odds) if commish else margin
+                margin = self.utils.bookmaker_margin(fav_odds, dog_odds, draw_odds)
+                commission_adj = self.utils.bookmaker_commission(fav_odds, dog_odds, commish, draw_odds) if commish else margin
                 juice = commission_adj
                 mirror_label = "3-way market" if draw_odds else "2-way market"
             else:
-                dec_odds = self.odds_converter.decimal_odds(odds)
+                dec_odds = self._dec(odds)
                 f_stake, u_stake = 1.0, 1.0
                 f_payout = self.payout_calc.decimal_payout(f_stake, dec_odds)
                 if dec_odds < 2.0:
                     u_american = int(100 * (dec_odds - 1))
                 else:
                     u_american = int(-100 * dec_odds / (dec_odds - 1))
-                u_dec = self.odds_converter.decimal_odds(u_american)
+                u_dec = self._dec(u_american)
                 u_payout = self.payout_calc.decimal_payout(u_stake, u_dec)
                 juice = self.utils.vig(f_stake, f_payout, u_stake, u_payout)
                 mirror_label = f"mirror {u_american}"
 
-            adj_pct = base_pct * (1 - max(juice, 0))
-            amount = (self.bank * Decimal(str(adj_pct))).quantize(Decimal("0.01"))
-            amount = self.risk.cap(amount, self.bank)
-            pct = float(amount / self.bank)
+            adj_pct = base_pct * (1.0 - max(juice, 0.0))
+            amount = self.risk.cap(_to_dec(int(self._bank_cents * adj_pct)), self.bank)
+            pct = float(amount) * 100 / self._bank_cents
 
             wager = Wager(
                 "vig",
@@ -301,12 +435,11 @@ class BnkRllBrn:
     # NEW BETTING SYSTEMS INTEGRATION
     # ————————————————————————————————
 
-    def five_bet_labouchere_bankroll(self, target: float) -> list[float]:
+    def five_bet_labouchere_bankroll(self, target: float) -> np.ndarray:
         """
         Generate a 5-bet Labouchere sequence scaled to a target win amount.
         """
-        labouchere_ratios = [0.1, 0.2, 0.4, 0.2, 0.1]
-        return [target * ratio for ratio in labouchere_ratios]
+        return target * _LAB5
 
     def labouchere_bet(self, target: float, odds: "Number") -> list["Wager"]:
         """
@@ -317,12 +450,12 @@ class BnkRllBrn:
         wagers = []
 
         for stake in sequence:
-            amount = self.risk.cap(Decimal(str(stake)), self.bank)
-            pct_bank = float(amount / self.bank)
+            amount = self.risk.cap(_to_dec(_cents(stake)), self.bank)
+            pct_bank = float(amount) * 100 / self._bank_cents
             wager = Wager(
                 strategy="labouchere",
                 amount=amount,
-                why=f"Labouchere sequence (target ${target})",
+                why=_WHY["labouchere"] % target,
                 risk=self.risk.level(pct_bank),
                 pct_bank=pct_bank,
                 ev=0,
@@ -340,13 +473,13 @@ class BnkRllBrn:
         self._check_bank()
         # Calculate bet amount using the progression formula
         bet_amount = base_bet * (multiplier ** consecutive_losses)
-        amount = self.risk.cap(Decimal(str(bet_amount)), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(_cents(bet_amount)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
 
         wager = Wager(
             "martingale",
             amount,
-            f"Martingale ×{multiplier} after {consecutive_losses} losses",
+            _WHY["martingale"] % (multiplier, consecutive_losses),
             self.risk.level(pct),
             pct,
             0,
@@ -366,13 +499,13 @@ class BnkRllBrn:
         bet_amount = base_bet + (losses * unit) - (wins * unit)
         # Ensure bet doesn't go below minimum
         bet_amount = max(bet_amount, base_bet * 0.1)
-        amount = self.risk.cap(Decimal(str(bet_amount)), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(_cents(bet_amount)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
 
         wager = Wager(
             "dalembert",
             amount,
-            f"D'Alembert: {wins} wins, {losses} losses",
+            _WHY["dalembert"] % (wins, losses),
             self.risk.level(pct),
             pct,
             0,
@@ -381,22 +514,13 @@ class BnkRllBrn:
         self._record(wager)
         return wager
 
-    def reverse_labouchere_sequence(self, target: float, num_bets: int = 5) -> list[float]:
+    def reverse_labouchere_sequence(self, target: float, num_bets: int = 5) -> np.ndarray:
         """
         Generate Reverse Labouchere sequence.
         """
         if num_bets == 5:
-            ratios = [0.2, 0.3, 0.5, 0.3, 0.2]
-        else:
-            # For other lengths, create symmetric sequence
-            mid_point = num_bets // 2
-            ratios = [0.1 * (i + 1) for i in range(mid_point + 1)]
-            if num_bets % 2 == 0:
-                ratios = ratios + ratios[-2::-1]
-            else:
-                ratios = ratios + ratios[-1::-1]
-        
-        return [target * ratio for ratio in ratios]
+            return target * _REVLAB5
+        return target * np.array(_revlab_ratios(num_bets))
 
     def reverse_labouchere_bet(self, target: float, num_bets: int = 5) -> list["Wager"]:
         """
@@ -407,12 +531,12 @@ class BnkRllBrn:
         wagers = []
 
         for stake in sequence:
-            amount = self.risk.cap(Decimal(str(stake)), self.bank)
-            pct_bank = float(amount / self.bank)
+            amount = self.risk.cap(_to_dec(_cents(stake)), self.bank)
+            pct_bank = float(amount) * 100 / self._bank_cents
             wager = Wager(
                 strategy="reverse_labouchere",
                 amount=amount,
-                why=f"Reverse Labouchere (target ${target})",
+                why=_WHY["reverse_labouchere"] % target,
                 risk=self.risk.level(pct_bank),
                 pct_bank=pct_bank,
                 ev=0,
@@ -428,13 +552,13 @@ class BnkRllBrn:
         Flat betting - fixed dollar amount regardless of bankroll.
         """
         self._check_bank()
-        amount = self.risk.cap(Decimal(str(fixed_amount)), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(_cents(fixed_amount)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
 
         wager = Wager(
             "flat",
             amount,
-            f"Flat betting ${fixed_amount} fixed ({pct:.1%} of bankroll)",
+            _WHY["flat"] % (fixed_amount, pct * 100),
             self.risk.level(pct),
             pct,
             0,
@@ -449,14 +573,13 @@ class BnkRllBrn:
         """
         self._check_bank()
         # Calculate bet amount as percentage of current bankroll
-        bet_amount = float(self.bank) * bet_pct
-        amount = self.risk.cap(Decimal(str(bet_amount)), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(int(self._bank_cents * bet_pct)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
 
         wager = Wager(
             "percentage",
             amount,
-            f"Percentage betting {bet_pct:.1%} of ${self.bank:,.0f} bankroll",
+            _WHY["percentage"] % (bet_pct * 100, self._bank_cents / 100),
             self.risk.level(pct),
             pct,
             0,
@@ -471,13 +594,13 @@ class BnkRllBrn:
         """
         self._check_bank()
         bet_amount = unit_size * num_units
-        amount = self.risk.cap(Decimal(str(bet_amount)), self.bank)
-        pct = float(amount / self.bank)
+        amount = self.risk.cap(_to_dec(_cents(bet_amount)), self.bank)
+        pct = float(amount) * 100 / self._bank_cents
 
         wager = Wager(
             "fixed_unit",
             amount,
-            f"Fixed unit: {num_units} × ${unit_size}",
+            _WHY["fixed_unit"] % (num_units, unit_size),
             self.risk.level(pct),
             pct,
             0,
@@ -486,40 +609,107 @@ class BnkRllBrn:
         self._record(wager)
         return wager
 
+    # ————————————————————————————————
+    # BATCH SIMULATION API — VECTORIZED
+    # ————————————————————————————————
+
+    def _dec_array(self, odds) -> np.ndarray:
+        """Convert an array-like of odds (any format) to decimal-odds floats.
+
+        A float64 array is assumed to already hold decimal odds and passes
+        through untouched. Beware NumPy upcasting: np.array([-110, 2.5])
+        is float64, so American int legs mixed with floats would be read
+        as decimal — keep American odds in a plain list or int array.
+        """
+        arr = np.asarray(odds)
+        if arr.dtype == np.float64:
+            return arr
+        return np.array([self._dec(o) for o in arr.tolist()], dtype=np.float64)
+
+    def _cap_vec(self, amounts: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of DynamicRiskManager.cap for dollar arrays."""
+        cap = (self._bank_cents / 100.0) * self.risk.max_risk
+        if self.risk.drawdown > 0.20:
+            cap *= 0.5
+        return np.minimum(amounts, cap)
+
+    def ev_kelly_batch(
+        self, p, odds, aggression: float = 2.0, true_p=None
+    ) -> Dict[str, np.ndarray]:
+        """
+        EV³-powered Kelly over N hypothetical bets in one vectorized pass.
+
+        Skips per-bet recording/logging — intended for Monte-Carlo sweeps
+        where calling ev_kelly() in a Python loop would dominate runtime.
+        Returns {'amount', 'pct', 'ev', 'kelly_f'} as float64 arrays.
+        Float64 odds arrays are taken as decimal format (see _dec_array).
+        """
+        kelly_f, ev = _kelly_vec(p, self._dec_array(odds), true_p)
+        weight = 1.0 + np.maximum(ev, 0.0) ** aggression * 8
+        pct = np.clip(kelly_f * weight, 0.0, 1.0)
+        pct = np.where(ev > 0.015, pct, 0.0)
+        amount = self._cap_vec(np.floor(self._bank_cents * pct) / 100.0)
+        return {"amount": amount, "pct": pct, "ev": ev, "kelly_f": kelly_f}
+
+    def pure_kelly_batch(self, p, odds, true_p=None) -> Dict[str, np.ndarray]:
+        """Pure Kelly over N hypothetical bets (no aggression weighting)."""
+        kelly_f, ev = _kelly_vec(p, self._dec_array(odds), true_p)
+        pct = np.clip(kelly_f, 0.0, 1.0)
+        pct = np.where(ev > 0, pct, 0.0)
+        amount = self._cap_vec(np.floor(self._bank_cents * pct) / 100.0)
+        return {"amount": amount, "pct": pct, "ev": ev, "kelly_f": kelly_f}
+
+    def simulate_bets(self, strategy: str, **arrays) -> Dict[str, np.ndarray]:
+        """
+        Batch entry point mirroring bet() for vectorized strategies.
+
+        Supported: 'ev' (p, o[, agg, true_p]), 'pure_kelly' (p, o[, true_p]).
+        """
+        if strategy == "ev":
+            return self.ev_kelly_batch(
+                arrays["p"], arrays["o"], arrays.get("agg", 2.0), arrays.get("true_p")
+            )
+        if strategy == "pure_kelly":
+            return self.pure_kelly_batch(arrays["p"], arrays["o"], arrays.get("true_p"))
+        raise ValueError("Invalid batch strategy. Use: ev, pure_kelly")
+
     # ————————————————————————————————
     # ROUTER + BANK MGMT - UPDATED
     # ————————————————————————————————
 
+    # Built once at class-construction time; bet() used to rebuild this dict
+    # (14 lambda allocations) on every call.
+    _DISPATCH: Dict[str, Callable] = {
+        "ev": lambda self, k: self.ev_kelly(k["p"], k["o"], k.get("agg", 2.0), k.get("true_p")),
+        "fib": lambda self, k: self.fib(k["o"], k.get("won", False), k.get("unit", 0.01), k.get("p")),
+        "vig": lambda self, k: self._vig_adjusted_bet(k["odds"], k.get("base_pct", 0.02)),
+        "pure_kelly": lambda self, k: self.pure_kelly(k["p"], k["o"], k.get("true_p")),
+        "elo_kelly": lambda self, k: self.elo_kelly(k["elo_diff"], k["o"], k.get("agg", 2.0), k.get("true_p")),
+        "parlay_bet": lambda self, k: self.parlay_bet(k["odds_list"], k.get("base_pct", 0.02)),
+        "margin_bet": lambda self, k: self.margin_bet(k["fav_odds"], k["dog_odds"], k.get("base_pct", 0.02)),
+        "labouchere": lambda self, k: self.labouchere_bet(k["target"], k["odds"]),
+        "martingale": lambda self, k: self.martingale_bet(k["base_bet"], k.get("losses", 0), k.get("multiplier", 2.0)),
+        "dalembert": lambda self, k: self.dalembert_bet(k["base_bet"], k.get("wins", 0), k.get("losses", 0)),
+        "reverse_labouchere": lambda self, k: self.reverse_labouchere_bet(k["target"], k.get("num_bets", 5)),
+        "flat": lambda self, k: self.flat_bet(k["fixed_amount"]),
+        "percentage": lambda self, k: self.percentage_bet(k["bet_pct"]),
+        "fixed_unit": lambda self, k: self.fixed_unit_bet(k["unit_size"], k.get("num_units", 1)),
+    }
+
     def bet(self, strategy: str, **kwargs) -> "Wager":
         """Single entry point for all strategies."""
-        strategies = {
-            "ev": lambda: self.ev_kelly(kwargs["p"], kwargs["o"], kwargs.get("agg", 2.0), kwargs.get("true_p")),
-            "fib": lambda: self.fib(kwargs["o"], kwargs.get("won", False), kwargs.get("unit", 0.01), kwargs.get("p")),
-            "vig": lambda: self._vig_adjusted_bet(kwargs["odds"], kwargs.get("base_pct", 0.02)),
-            "pure_kelly": lambda: self.pure_kelly(kwargs["p"], kwargs["o"], kwargs.get("true_p")),
-            "elo_kelly": lambda: self.elo_kelly(kwargs["elo_diff"], kwargs["o"], kwargs.get("agg", 2.0), kwargs.get("true_p")),
-            "parlay_bet": lambda: self.parlay_bet(kwargs["odds_list"], kwargs.get("base_pct", 0.02)),
-            "margin_bet": lambda: self.margin_bet(kwargs["fav_odds"], kwargs["dog_odds"], kwargs.get("base_pct", 0.02)),
-            "labouchere": lambda: self.labouchere_bet(kwargs["target"], kwargs["odds"]),
-            "martingale": lambda: self.martingale_bet(kwargs["base_bet"], kwargs.get("losses", 0), kwargs.get("multiplier", 2.0)),
-            "dalembert": lambda: self.dalembert_bet(kwargs["base_bet"], kwargs.get("wins", 0), kwargs.get("losses", 0)),
-            "reverse_labouchere": lambda: self.reverse_labouchere_bet(kwargs["target"], kwargs.get("num_bets", 5)),
-            "flat": lambda: self.flat_bet(kwargs["fixed_amount"]),  
-            "percentage": lambda: self.percentage_bet(kwargs["bet_pct"]),
-            "fixed_unit": lambda: self.fixed_unit_bet(kwargs["unit_size"], kwargs.get("num_units", 1))
-        }
-
-        if strategy not in strategies:
-            raise ValueError(f"Invalid strategy. Use: {', '.join(strategies.keys())}")
-
-        return strategies[strategy]()
+        try:
+            handler = self._DISPATCH[strategy]
+        except KeyError:
+            raise ValueError(f"Invalid strategy. Use: {_STRATEGY_NAMES}") from None
+        return handler(self, kwargs)
     def update_bank(self, new: Decimal, won: bool = False) -> None:
         """Update bankroll and reset Fibonacci on win."""
         with self._lock:
             self.bank = new
             if won:
                 self.fib_streak = 0
-            self.logger.info(f"Bankroll → ${self.bank:,.0f}")
+            self.logger.info("Bankroll → $%.0f", float(self.bank))
 
     # ————————————————————————————————
     # SUMMARY + SHUTDOWN
@@ -528,21 +718,25 @@ class BnkRllBrn:
     def summary(self) -> None:
         """Print final performance report with vig/BE insights."""
         dd = float((self.peak - self.bank) / self.peak) * 100 if self.peak > 0 else 0
-        placed_bets = [w for w in self.history.buffer if w.amount > 0]
-        total_wagered = sum(float(w.amount) for w in placed_bets)
+        amounts = self.history.amounts
+        placed = amounts > 0
+        total_wagered = float(amounts[placed].sum())
         roi = (float(self.bank - self.peak) / total_wagered * 100) if total_wagered > 0 else 0
 
         avg_vig, avg_be = 0.0, 0.0
-        if placed_bets:
-            sample_odds = [getattr(w, "odds", None) for w in placed_bets[:10] if getattr(w, "odds", None)]
-            if sample_odds:
-                avg_vig = sum(
-                    self.utils.vig(1, self.payout_calc.decimal_payout(1, self.odds_converter.decimal_odds(o)), 1, self.payout_calc.decimal_payout(1, self.odds_converter.decimal_odds(o)))
-                    for o in sample_odds
-                ) / len(sample_odds)
-                avg_be = sum(
-                    break_even_pct(1, self.payout_calc.decimal_payout(1, self.odds_converter.decimal_odds(o))) for o in sample_odds
-                ) / len(sample_odds)
+        if placed.any():
+            # dec_odds was cached at record time, so this is pure aggregation
+            # — no odds re-conversion per sampled bet.
+            sample_dec = []
+            for w in self.history.buffer:
+                if w.amount > 0 and w.dec_odds:
+                    sample_dec.append(w.dec_odds)
+                    if len(sample_dec) == 10:
+                        break
+            if sample_dec:
+                payouts = [self.payout_calc.decimal_payout(1, d) for d in sample_dec]
+                avg_vig = sum(self.utils.vig(1, pay, 1, pay) for pay in payouts) / len(payouts)
+                avg_be = sum(self.utils.break_even_pct(1, pay) for pay in payouts) / len(payouts)
             else:
                 self.logger.warning("Sample odds unavailable — add 'odds' to Wager for accurate avg vig/BE")
 
@@ -1,8 +1,119 @@
 from fractions import Fraction
-from math import gcd
+from functools import lru_cache
+from math import prod
 import numpy as np
 from typing import Union
 
+# Accepted style aliases collapsed to a canonical tag; one dict probe
+# replaces the chained list-membership tests in the dispatchers below.
+_STYLE = {s: 'a' for s in ('a', 'amer', 'american')}
+_STYLE.update({s: 'd' for s in ('d', 'dec', 'decimal')})
+_STYLE.update({s: 'f' for s in ('f', 'frac', 'fractional')})
+
+
+# Per-type conversion bodies live at module level so the string-parse
+# paths — the expensive ones — can be memoized. Odds feeds repeat a small
+# set of distinct lines, so a bounded cache absorbs nearly every parse.
+@lru_cache(maxsize=4096)
+def _american_from_str(odds: str) -> int:
+    if "/" in odds:
+        odds_frac = Fraction(odds)
+        frac = odds_frac.numerator / odds_frac.denominator
+        return int(frac * 100) if odds_frac.numerator >= odds_frac.denominator else int(-100 / frac)
+
+    try:
+        if odds.startswith('+'):
+            return int(odds[1:])
+        elif odds.startswith('-'):
+            return int(odds)
+        else:
+            # Assume positive if no sign
+            return int(odds)
+    except ValueError:
+        raise ValueError(f"Unsupported odds format: {odds}")
+
+
+def _american_from_int(odds: int) -> int:
+    return odds
+
+
+def _american_from_float(odds: float) -> int:
+    if odds > 2.0:
+        return int((odds - 1) * 100)
+    else:
+        return int(-100 / (odds - 1))
+
+
+@lru_cache(maxsize=4096)
+def _decimal_from_str(odds: str) -> float:
+    if "/" in odds:
+        return round(float(Fraction(odds)) + 1, 2)
+
+    try:
+        if odds.startswith('+'):
+            val = int(odds[1:])
+            return 1 + (val / 100.0)
+        elif odds.startswith('-'):
+            val = int(odds[1:])
+            if val < 100:
+                raise ValueError(f"Invalid negative American odds: {odds} (must be <= -100)")
+            return 1 + (100.0 / val)
+        else:
+            # Assume it's a number string
+            val = int(odds)
+            return _decimal_from_int(val)
+    except ValueError:
+        raise ValueError(f"Unsupported odds format: {odds}")
+
+
+def _decimal_from_int(odds: int) -> float:
+    if odds >= 100:
+        return 1 + (odds / 100.0)
+    elif odds <= -101:
+        return 1 + (100.0 / abs(odds))
+    else:
+        return float(odds)
+
+
+def _decimal_from_float(odds: float) -> float:
+    return odds
+
+
+@lru_cache(maxsize=4096)
+def _fractional_from_str(odds: str) -> Fraction:
+    return Fraction(odds)
+
+
+def _fractional_from_int(odds: int) -> Fraction:
+    if odds > 0:
+        return Fraction(odds, 100)
+    else:
+        return Fraction(-100, abs(odds))
+
+
+def _fractional_from_float(odds: float) -> Fraction:
+    # limit_denominator rounds to the nearest /100 fraction in one native
+    # pass, instead of scaling through int cents and reducing by hand.
+    return Fraction(odds - 1).limit_denominator(100)
+
+
+# Exact-type dispatch: one dict probe replaces the isinstance ladder each
+# conversion used to walk. Subclasses of int/float/str (np.float64 legs
+# pulled out of an ndarray, IntEnum lines, ...) miss the probe and resolve
+# through _converter_for, which registers them so the next hit is a probe.
+_AMERICAN_DISPATCH = {int: _american_from_int, float: _american_from_float, str: _american_from_str}
+_DECIMAL_DISPATCH = {int: _decimal_from_int, float: _decimal_from_float, str: _decimal_from_str}
+_FRACTIONAL_DISPATCH = {int: _fractional_from_int, float: _fractional_from_float, str: _fractional_from_str}
+
+
+def _converter_for(dispatch: dict, odds):
+    """Converter for a subclass of a dispatched type, cached for reuse."""
+    for base, fn in list(dispatch.items()):
+        if isinstance(odds, base):
+            dispatch[type(odds)] = fn
+            return fn
+    raise ValueError(f"Unsupported odds format: {odds}") from None
+
 
 class OddsConverter:
     """
@@ -32,38 +143,10 @@ class OddsConverter:
         Returns:
             int: Odds in American format.
         """
-        # Handle string inputs like "-150", "+150", "150"
-        if isinstance(odds, str):
-            # Check if it's a fractional odds string
-            if "/" in odds:
-                odds_frac = Fraction(odds)
-                frac = odds_frac.numerator / odds_frac.denominator
-                return int(frac * 100) if odds_frac.numerator >= odds_frac.denominator else int(-100 / frac)
-            
-            # Handle American odds as strings ("-150", "+150", "150")
-            try:
-                # Remove + sign if present and convert to int
-                if odds.startswith('+'):
-                    return int(odds[1:])
-                elif odds.startswith('-'):
-                    return int(odds)
-                else:
-                    # Assume positive if no sign
-                    return int(odds)
-            except ValueError:
-                raise ValueError(f"Unsupported odds format: {odds}")
-
-        elif isinstance(odds, int):
-            return odds
-
-        elif isinstance(odds, float):
-            if odds > 2.0:
-                return int((odds - 1) * 100)
-            else:
-                return int(-100 / (odds - 1))
-
-        else:
-            raise ValueError(f"Unsupported odds format: {odds}")
+        try:
+            return _AMERICAN_DISPATCH[type(odds)](odds)
+        except KeyError:
+            return _converter_for(_AMERICAN_DISPATCH, odds)(odds)
 
     def decimal_odds(self, odds: Union[int, float, str]) -> float:
         """
@@ -75,44 +158,10 @@ class OddsConverter:
         Returns:
             float: Odds in Decimal format.
         """
-        if isinstance(odds, float):
-            return odds
-
-        elif isinstance(odds, int):
-            if odds >= 100:
-                return 1 + (odds / 100.0)
-            elif odds <= -101:
-                return 1 + (100.0 / abs(odds))
-            else:
-                return float(odds)
-
-        elif isinstance(odds, str):
-            if "/" in odds:
-                return round(float(Fraction(odds)) + 1, 2)
-            
-            # Handle American odds as strings
-            try:
-                if odds.startswith('+'):
-                    val = int(odds[1:])
-                    return 1 + (val / 100.0)
-                elif odds.startswith('-'):
-                    val = int(odds[1:])
-                    if val < 100:
-                        raise ValueError(f"Invalid negative American odds: {odds} (must be <= -100)")
-                    return 1 + (100.0 / val)
-                else:
-                    # Assume it's a number string
-                    val = int(odds)
-                    if val >= 100:
-                        return 1 + (val / 100.0)
-                    elif val <= -101:
-                        return 1 + (100.0 / abs(val))
-                    else:
-                        return float(val)
-            except ValueError:
-                raise ValueError(f"Unsupported odds format: {odds}")
-
-        raise ValueError(f"Unsupported odds format: {odds}")
+        try:
+            return _DECIMAL_DISPATCH[type(odds)](odds)
+        except KeyError:
+            return _converter_for(_DECIMAL_DISPATCH, odds)(odds)
 
     def fractional_odds(self, odds: Union[int, float, str]) -> Fraction:
         """
@@ -124,24 +173,13 @@ class OddsConverter:
         Returns:
             Fraction: Odds as a Fraction.
         """
-        if isinstance(odds, str):
-            return Fraction(odds)
-
-        elif isinstance(odds, int):
-            if odds > 0:
-                g_cd = gcd(odds, 100)
-                return Fraction(odds // g_cd, 100 // g_cd)
-            else:
-                g_cd = gcd(100, abs(odds))
-                return Fraction(-100 // g_cd, abs(odds) // g_cd)
-
-        elif isinstance(odds, float):
-            new_odds = int(round((odds - 1) * 100))
-            g_cd = gcd(abs(new_odds), 100)
-            return Fraction(abs(new_odds) // g_cd, 100 // g_cd) * (1 if new_odds >= 0 else -1)
+        if isinstance(odds, Fraction):
+            return odds
 
-        else:
-            raise ValueError(f"Unsupported odds format: {odds}")
+        try:
+            return _FRACTIONAL_DISPATCH[type(odds)](odds)
+        except KeyError:
+            return _converter_for(_FRACTIONAL_DISPATCH, odds)(odds)
 
     def parlay_odds(self, odds_list: list) -> float:
         """
@@ -153,7 +191,35 @@ class OddsConverter:
         Returns:
             float: Parlay odds in Decimal format.
         """
-        return np.prod([self.decimal_odds(x) for x in odds_list])
+        # Typical slips run 2-10 legs, where ndarray setup costs more than
+        # it saves; math.prod is a C-level loop with no allocation at all.
+        if len(odds_list) <= 1000:
+            dec = self.decimal_odds  # bind once, not per leg
+            return prod(dec(x) for x in odds_list)
+
+        # Split the legs into homogeneous groups once so the numeric bulk
+        # reduces as contiguous arrays instead of per-element Python calls.
+        ints, floats, other = [], [], []
+        for x in odds_list:
+            if type(x) is int:
+                ints.append(x)
+            elif type(x) is float:
+                floats.append(x)
+            else:
+                other.append(x)
+
+        product = 1.0
+        if ints:
+            a = np.asarray(ints, dtype=np.int64)
+            dec = np.where(a >= 100, 1.0 + a / 100.0,
+                           np.where(a <= -101, 1.0 + 100.0 / np.abs(a),
+                                    a.astype(np.float64)))
+            product *= dec.prod()
+        if floats:
+            product *= np.asarray(floats, dtype=np.float64).prod()
+        for x in other:
+            product *= self.decimal_odds(x)
+        return float(product)
 
     def convert_odds(self, odds: Union[int, float, str], style: str = 'a') -> Union[int, float, Fraction, None]:
         """
@@ -167,12 +233,12 @@ class OddsConverter:
             Union[int, float, Fraction, None]: Converted odds or None if invalid.
         """
         try:
-            style_lower = style.lower()
-            if style_lower in ['a', 'amer', 'american']:
+            tag = _STYLE.get(style.lower())
+            if tag == 'a':
                 return self.american_odds(odds)
-            elif style_lower in ['d', 'dec', 'decimal']:
+            elif tag == 'd':
                 return self.decimal_odds(odds)
-            elif style_lower in ['f', 'frac', 'fractional']:
+            elif tag == 'f':
                 return self.fractional_odds(odds)
         except (ValueError, KeyError, NameError):
             return None
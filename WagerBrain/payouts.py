@@ -1,6 +1,43 @@
 from fractions import Fraction
-from typing import Union, List
-from WagerBrain.odds import OddsConverter
+from functools import lru_cache
+from typing import Union, List, Tuple
+from WagerBrain.odds import OddsConverter, _STYLE
+
+
+@lru_cache(maxsize=1024)
+def _parse_frac(s: str) -> Tuple[int, int]:
+    """Parse a fractional-odds string once; sportsbook lines repeat heavily."""
+    f = Fraction(s)
+    return f.numerator, f.denominator
+
+
+@lru_cache(maxsize=512)
+def _parlay_decimal_cached(key: tuple) -> float:
+    """Combined decimal odds for a slip; repeat slips hit the cache.
+
+    key pairs each leg with its type: 150 (American) and 150.0 (decimal)
+    hash and compare equal as bare tuple elements, so an untyped key would
+    hand one format's result to the other.
+    """
+    return PayoutCalculator._odds_converter.parlay_odds([x for _, x in key])
+
+
+def _parlay_decimal(odds: list) -> float:
+    """Parlay decimal odds, memoized when every leg is hashable."""
+    try:
+        return _parlay_decimal_cached(tuple((type(x), x) for x in odds))
+    except TypeError:  # unhashable leg (e.g. nested list) — convert directly
+        return PayoutCalculator._odds_converter.parlay_odds(odds)
+
+
+def _frac_ratio(odds: Union[str, Fraction]) -> Tuple[int, int]:
+    """(numerator, denominator) without rebuilding already-parsed Fractions."""
+    if isinstance(odds, Fraction):
+        return odds.numerator, odds.denominator
+    if isinstance(odds, str):
+        return _parse_frac(odds)
+    f = Fraction(odds)
+    return f.numerator, f.denominator
 
 
 class PayoutCalculator:
@@ -12,9 +49,13 @@ class PayoutCalculator:
     Profit = Payout - Stake
     """
 
+    # One stateless converter shared by every instance; per-wager
+    # constructions of this class no longer allocate their own.
+    _odds_converter = OddsConverter()
+
     def __init__(self):
         """Initialize the payout calculator with odds converter utility."""
-        self.odds_converter = OddsConverter()
+        self.odds_converter = self._odds_converter
 
     def american_payout(self, stake: float, odds: Union[int, str]) -> float:
         """
@@ -80,8 +121,8 @@ class PayoutCalculator:
             >>> fractional_payout(50, Fraction(5, 4))  # $50 at 5/4
             112.5
         """
-        odds_frac = Fraction(odds)
-        return (stake * (odds_frac.numerator / odds_frac.denominator)) + stake
+        n, d = _frac_ratio(odds)
+        return (stake * n / d) + stake
 
     def american_profit(self, stake: float, odds: Union[int, str]) -> float:
         """
@@ -147,8 +188,8 @@ class PayoutCalculator:
             >>> fractional_profit(50, Fraction(5, 4))  # $50 at 5/4
             62.5
         """
-        odds_frac = Fraction(odds)
-        return stake * (odds_frac.numerator / odds_frac.denominator)
+        n, d = _frac_ratio(odds)
+        return stake * n / d
 
     def get_payout(self, odds: Union[int, float, str, Fraction], stake: float, odds_style: str = 'a') -> Union[float, None]:
         """
@@ -171,17 +212,17 @@ class PayoutCalculator:
             400.0
         """
         try:
-            odds_style = odds_style.lower()
-            
-            if odds_style in ["american", "amer", "a"]:
+            tag = _STYLE.get(odds_style.lower())
+
+            if tag == 'a':
                 return self.american_payout(stake, odds)
-            elif odds_style in ["decimal", "dec", "d"]:
+            elif tag == 'd':
                 return self.decimal_payout(stake, odds)
-            elif odds_style in ["fractional", "frac", "f"]:
+            elif tag == 'f':
                 return self.fractional_payout(stake, odds)
             else:
                 raise ValueError(f"Unsupported odds style: {odds_style}")
-                
+
         except (ValueError, ZeroDivisionError) as e:
             print(f"Error calculating payout: {e}")
             return None
@@ -207,17 +248,17 @@ class PayoutCalculator:
             300.0
         """
         try:
-            odds_style = odds_style.lower()
-            
-            if odds_style in ["american", "amer", "a"]:
+            tag = _STYLE.get(odds_style.lower())
+
+            if tag == 'a':
                 return self.american_profit(stake, odds)
-            elif odds_style in ["decimal", "dec", "d"]:
+            elif tag == 'd':
                 return self.decimal_profit(stake, odds)
-            elif odds_style in ["fractional", "frac", "f"]:
+            elif tag == 'f':
                 return self.fractional_profit(stake, odds)
             else:
                 raise ValueError(f"Unsupported odds style: {odds_style}")
-                
+
         except (ValueError, ZeroDivisionError) as e:
             print(f"Error calculating profit: {e}")
             return None
@@ -241,7 +282,7 @@ class PayoutCalculator:
             >>> parlay_profit(['3/1', '1/2'], 100) # Fractional odds parlay
             525.0
         """
-        parlay_odds = self.odds_converter.parlay_odds(odds)
+        parlay_odds = _parlay_decimal(odds)
         return (parlay_odds * stake) - stake
 
     def parlay_payout(self, odds: List[Union[int, float, str, Fraction]], stake: float) -> float:
@@ -263,5 +304,26 @@ class PayoutCalculator:
             >>> parlay_payout(['3/1', '1/2'], 100) # Fractional odds parlay
             625.0
         """
-        parlay_odds = self.odds_converter.parlay_odds(odds)
+        parlay_odds = _parlay_decimal(odds)
         return parlay_odds * stake
+
+    def parlay_payout_and_profit(self, odds: List[Union[int, float, str, Fraction]], stake: float) -> Tuple[float, float]:
+        """
+        Calculate payout and profit for a parlay in one conversion pass.
+
+        Prefer this over calling parlay_payout and parlay_profit separately:
+        the odds list is reduced once instead of twice.
+
+        Args:
+            odds (list): List of odds for wagers in the parlay
+            stake (float): Amount wagered on the parlay
+
+        Returns:
+            tuple: (total payout, net profit)
+
+        Examples:
+            >>> parlay_payout_and_profit([2.5, 1.5], 100)
+            (375.0, 275.0)
+        """
+        payout = _parlay_decimal(odds) * stake
+        return payout, payout - stake
@@ -1,7 +1,9 @@
 from fractions import Fraction
 from typing import Union
-from WagerBrain.odds import OddsConverter
+import numpy as np
+from WagerBrain.odds import OddsConverter, _STYLE
 from WagerBrain.utils import MarketUtils
+from WagerBrain._kernels import _elo_prob, _true_ev, _prob_to_american, elo_prob_vec
 
 
 class ProbabilityCalculator:
@@ -12,9 +14,13 @@ class ProbabilityCalculator:
     Includes ELO-based probability calculations for sports predictions.
     """
 
+    # One stateless converter shared by every instance; per-wager
+    # constructions of this class no longer allocate their own.
+    _odds_converter = OddsConverter()
+
     def __init__(self):
         """Initialize the probability calculator with odds converter utility."""
-        self.odds_converter = OddsConverter()
+        self.odds_converter = self._odds_converter
 
     def decimal_implied_win_prob(self, odds: Union[float, int, str]) -> float:
         """
@@ -55,12 +61,47 @@ class ProbabilityCalculator:
             >>> american_implied_win_prob('+300') # String input
             0.25
         """
-        american_odds_val = self.odds_converter.american_odds(odds)
-        
-        if american_odds_val > 0:
-            return round(100 / (american_odds_val + 100), 3)
+        if type(odds) is int:
+            # Already American — skip the converter dispatch entirely.
+            a = odds
+        else:
+            a = self.odds_converter.american_odds(odds)
+
+        if a > 0:
+            return round(100 / (a + 100), 3)
         else:
-            return round(abs(american_odds_val) / (abs(american_odds_val) + 100), 3)
+            a = abs(a)
+            return round(a / (a + 100), 3)
+
+    def decimal_implied_win_prob_batch(self, odds: np.ndarray) -> np.ndarray:
+        """
+        Calculate implied win probabilities for an array of Decimal odds.
+
+        Args:
+            odds (np.ndarray): Odds in Decimal format (float convertible).
+
+        Returns:
+            np.ndarray: Implied win probabilities rounded to 3 decimal places.
+        """
+        return (1.0 / np.asarray(odds, dtype=np.float64)).round(3)
+
+    def american_implied_win_prob_batch(self, odds: np.ndarray) -> np.ndarray:
+        """
+        Calculate implied win probabilities for an array of American odds.
+
+        Args:
+            odds (np.ndarray): Odds in American format (int convertible).
+
+        Returns:
+            np.ndarray: Implied win probabilities rounded to 3 decimal places.
+        """
+        a = np.asarray(odds, dtype=np.int64)
+        pos = a > 0
+        out = np.empty(a.shape, dtype=np.float64)
+        out[pos] = 100.0 / (a[pos] + 100.0)
+        neg = -a[~pos]
+        out[~pos] = neg / (neg + 100.0)
+        return out.round(3)
 
     def fractional_implied_win_prob(self, odds: Union[str, Fraction]) -> float:
         """
@@ -80,6 +121,9 @@ class ProbabilityCalculator:
             >>> fractional_implied_win_prob(Fraction(5, 4))  # 44.4% probability
             0.444
         """
+        if isinstance(odds, Fraction):
+            # Skip the converter round trip: p = d / (n + d) exactly.
+            return round(odds.denominator / (odds.numerator + odds.denominator), 3)
         odds_frac = self.odds_converter.fractional_odds(odds)
         return round(1 / ((odds_frac.numerator / odds_frac.denominator) + 1), 3)
 
@@ -132,7 +176,7 @@ class ProbabilityCalculator:
             >>> true_odds_ev(100, 200, 0.5)   # Fair bet
             50.0
         """
-        return (profit * prob) - (stake * (1 - prob))
+        return _true_ev(float(stake), float(profit), float(prob))
 
     def win_prob_to_odds(self, prob: float, odds_style: str = "a") -> Union[int, float, Fraction, None]:
         """
@@ -157,18 +201,15 @@ class ProbabilityCalculator:
             if prob <= 0 or prob >= 1:
                 raise ValueError("Probability must be between 0 and 1")
 
-            odds_style = odds_style.lower()
-            
-            if odds_style in ["american", "amer", "a"]:
-                if prob >= 0.50:
-                    return int((prob / (1 - prob)) * -100)
-                else:
-                    return int(((1 - prob) / prob) * 100)
+            tag = _STYLE.get(odds_style.lower())
+
+            if tag == 'a':
+                return int(_prob_to_american(prob))
 
-            elif odds_style in ["decimal", "dec", "d"]:
+            elif tag == 'd':
                 return round(1 / prob, 2)
 
-            elif odds_style in ["fractional", "frac", "f"]:
+            elif tag == 'f':
                 if prob == 1.0:
                     return Fraction(0, 1)
                 fractional_value = (1 / prob) - 1
@@ -181,6 +222,37 @@ class ProbabilityCalculator:
             print(f"Error converting probability to odds: {e}")
             return None
 
+    def win_prob_to_odds_array(self, probs: np.ndarray, odds_style: str = "a") -> Union[np.ndarray, list]:
+        """
+        Convert an array of win probabilities to stated odds in one pass.
+
+        Args:
+            probs (np.ndarray): Win probabilities (each strictly between 0 and 1).
+            odds_style (str): Target format: 'a'/'american', 'd'/'decimal', 'f'/'fractional'.
+
+        Returns:
+            np.ndarray: int64 American odds or float decimal odds; for
+            fractional style, a list of Fraction objects.
+        """
+        probs = np.asarray(probs, dtype=np.float64)
+        tag = _STYLE.get(odds_style.lower())
+
+        if tag == 'd':
+            return np.round(1.0 / probs, 2)
+
+        if tag == 'a':
+            q = 1.0 - probs
+            out = np.where(probs >= 0.5, -100.0 * probs / q, 100.0 * q / probs)
+            # np.where truncates nothing — match the scalar int() truncation.
+            return np.trunc(out).astype(np.int64)
+
+        if tag == 'f':
+            # Only the Fraction construction stays in Python.
+            vals = 1.0 / probs - 1.0
+            return [Fraction(v).limit_denominator() for v in vals]
+
+        raise ValueError(f"Unsupported odds style: {odds_style}")
+
     def elo_prob(self, elo_diff: float) -> float:
         """
         Calculate win probability based on ELO rating difference.
@@ -200,4 +272,16 @@ class ProbabilityCalculator:
             >>> elo_prob(-150)   # Team A underdog by 150 ELO points
             0.3
         """
-        return 1 / (10**(-elo_diff / 400) + 1)
+        return _elo_prob(float(elo_diff))
+
+    def elo_prob_batch(self, elo_diffs: np.ndarray) -> np.ndarray:
+        """
+        Calculate win probabilities for an array of ELO rating differences.
+
+        Args:
+            elo_diffs (np.ndarray): Rating differences, one per matchup.
+
+        Returns:
+            np.ndarray: Win probabilities (float64), same shape as the input.
+        """
+        return elo_prob_vec(np.asarray(elo_diffs, dtype=np.float64))
@@ -1,5 +1,11 @@
+from bisect import bisect_left
 from dataclasses import dataclass, asdict
 from decimal import Decimal, getcontext
+import logging
+
+_LOG = logging.getLogger("WagerBrain")
+
+_RISK_LABELS = ("low", "medium", "high", "insane")
 
 # ————————————————————————————————
 # 2. DYNAMIC RISK MANAGER — SELF-HEALING
@@ -32,27 +38,34 @@ class DynamicRiskManager:
     def __init__(self, base: RiskThresholds, max_risk_pct: float):
         self.base = base
         self.max_risk = min(1.0, max(0.01, float(max_risk_pct)))
-        self.peak = Decimal("0")
+        # Peak/drawdown tracking runs in float64: percent-of-bankroll math
+        # tolerates FP error and Decimal ops cost ~2 orders of magnitude more.
+        self.peak = 0.0
         self.drawdown = 0.0
+        # Sorted band edges, precomputed once for level() lookups.
+        self._thr = (base.low, base.med, base.high)
 
     def update(self, bank: Decimal) -> None:
         """Update peak and calculate current drawdown %."""
-        self.peak = max(self.peak, bank)
-        self.drawdown = float((self.peak - bank) / self.peak) if self.peak > 0 else 0
+        b = float(bank)
+        if b > self.peak:
+            self.peak = b
+        self.drawdown = (self.peak - b) / self.peak if self.peak > 0 else 0.0
 
     def level(self, pct: float) -> str:
-        """Classify risk with drawdown penalty."""
+        """Classify risk with drawdown penalty via a sorted-band bisect."""
         adj = pct * (1 + self.drawdown * 2)
-        if adj <= self.base.low: return "low"
-        if adj <= self.base.med: return "medium"
-        if adj <= self.base.high: return "high"
-        return "insane"
+        return _RISK_LABELS[bisect_left(self._thr, adj)]
 
     def cap(self, amount: Decimal, bank: Decimal) -> Decimal:
         """Apply hard cap + drawdown protection."""
-        cap = bank * Decimal(str(self.max_risk))
+        cap_f = float(bank) * self.max_risk
         if self.drawdown > 0.20:
-            cap *= Decimal("0.5")
-            logging.getLogger("WagerBrain").info("DRAWDOWN >20% — RISK CUT 50%")
-        return min(amount, cap)
+            cap_f *= 0.5
+            if _LOG.isEnabledFor(logging.INFO):
+                _LOG.info("DRAWDOWN >20% — RISK CUT 50%")
+        if float(amount) <= cap_f:
+            return amount
+        # Decimal only at the boundary so callers keep exact money types.
+        return Decimal(repr(cap_f))
 
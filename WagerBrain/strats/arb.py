@@ -1,5 +1,33 @@
+import numpy as np
 from WagerBrain import ProbabilityCalculator, OddsConverter
 
+
+def _arb2(o0, o1, stake):
+    """2-way arbitrage core on decimal floats.
+
+    Returns (profit, probabilities, arb_percent) or None when the market
+    is fair or worse. No list/dict/exception machinery — scanner loops
+    hit this thousands of times.
+    """
+    p0 = round(1.0 / o0, 3)
+    p1 = round(1.0 / o1, 3)
+    s = p0 + p1
+    if s >= 1.0:
+        return None
+    return stake / s - stake, (p0, p1), s
+
+
+def _arb3(o0, o1, o2, stake):
+    """3-way arbitrage core on decimal floats; see _arb2."""
+    p0 = round(1.0 / o0, 3)
+    p1 = round(1.0 / o1, 3)
+    p2 = round(1.0 / o2, 3)
+    s = p0 + p1 + p2
+    if s >= 1.0:
+        return None
+    return stake / s - stake, (p0, p1, p2), s
+
+
 class ArbitrageCalculator:
     """
     Advanced arbitrage detection and calculation system.
@@ -33,15 +61,14 @@ class ArbitrageCalculator:
             raise ValueError("Odds input must be a list of length 2 (2-way) or 3 (3-way)")
 
         market_type = '3-way' if len(odds) == 3 else '2-way'
-        
-        # Calculate implied probabilities for all outcomes
-        probabilities = []
-        for odd in odds:
-            prob = self.prob_calc.decimal_implied_win_prob(odd)
-            probabilities.append(prob)
-        
-        arb_percent = sum(probabilities)
-        vig = arb_percent - 1 if arb_percent > 1 else 0
+
+        # One reciprocal over the whole market instead of a method call per
+        # outcome; non-float legs still convert through the odds converter.
+        dec = [x if type(x) is float else self.odds_converter.decimal_odds(x) for x in odds]
+        probs = np.round(1.0 / np.asarray(dec, dtype=np.float64), 3)
+        probabilities = probs.tolist()
+        arb_percent = float(probs.sum())
+        vig = max(0.0, arb_percent - 1.0)  # branchless clamp at fair odds
         
         return {
             'arb_percent': arb_percent,
@@ -102,27 +129,28 @@ class ArbitrageCalculator:
             if not isinstance(odds, list) or len(odds) not in [2, 3]:
                 return None
 
-            arb_data = self.arb_percentage(odds)
+            dec = [x if type(x) is float else self.odds_converter.decimal_odds(x) for x in odds]
+            if len(dec) == 2:
+                core = _arb2(dec[0], dec[1], stake)
+            else:
+                core = _arb3(dec[0], dec[1], dec[2], stake)
 
             # No arbitrage if combined probability >= 100%
-            if arb_data['arb_percent'] >= 1.0:
+            if core is None:
                 return None
-                
-            profit = self.arb_profit(arb_data, stake)
-            stakes = self.calculate_stakes(arb_data, stake)
-            roi = (profit / stake) * 100
-            
+
+            profit, probs, arb_percent = core
             return {
                 'profit': round(profit, 2),
-                'stakes': stakes,
+                'stakes': [round(p * stake / arb_percent, 2) for p in probs],
                 'total_stake': stake,
-                'arb_percent': round(arb_data['arb_percent'], 4),
-                'vig': round(arb_data['vig'], 4),
-                'market_type': arb_data['market_type'],
-                'probabilities': [round(p, 4) for p in arb_data['probabilities']],
-                'roi': round(roi, 2)
+                'arb_percent': round(arb_percent, 4),
+                'vig': 0.0,  # a priced arb is sub-fair by definition
+                'market_type': '3-way' if len(probs) == 3 else '2-way',
+                'probabilities': [round(p, 4) for p in probs],
+                'roi': round((profit / stake) * 100, 2)
             }
-            
+
         except Exception as e:
             print(f"Arbitrage calculation error: {e}")
             return None
@@ -155,29 +183,36 @@ class ArbitrageCalculator:
         Returns:
             dict: Best arbitrage opportunity across books
         """
-        best_arb = None
-        best_profit = 0
-        
-        for i, book1_odds in enumerate(odds_matrix):
-            for j, book2_odds in enumerate(odds_matrix):
-                if i != j:  # Different books
-                    # Take best odds from each book
-                    if market_type == '2-way':
-                        combined_odds = [max(book1_odds[0], book2_odds[0]), 
-                                       max(book1_odds[1], book2_odds[1])]
-                    else:  # 3-way
-                        combined_odds = [max(book1_odds[0], book2_odds[0]),
-                                       max(book1_odds[1], book2_odds[1]),
-                                       max(book1_odds[2], book2_odds[2])]
-                    
-                    arb_opp = self.basic_arbitrage(combined_odds, stake)
-                    if arb_opp and arb_opp['profit'] > best_profit:
-                        best_profit = arb_opp['profit']
-                        best_arb = arb_opp
-                        best_arb['books_used'] = [i, j]
-                        best_arb['combined_odds'] = combined_odds
-        
-        return best_arb
+        if len(odds_matrix) < 2:
+            return None
+
+        # The best line per outcome across ALL books dominates every
+        # two-book combination the old pairwise loop tried, so one
+        # column-wise max replaces the O(N²) sweep. Non-float legs
+        # (American ints, fractional strings) convert to decimal first.
+        M = np.asarray([
+            [x if type(x) is float else self.odds_converter.decimal_odds(x) for x in row]
+            for row in odds_matrix
+        ], dtype=np.float64)
+
+        # One reciprocal pass gives the implied-probability matrix; the best
+        # line per outcome is its column minimum, and a market whose best
+        # probabilities still sum to >= 1 can be rejected here without any
+        # of the result-dict work.
+        P = np.round(np.reciprocal(M), 3)
+        if float(P.min(axis=0).sum()) >= 1.0:
+            return None
+        # argmax over odds, not argmin over the rounded probabilities —
+        # 3-dp probs can tie where the underlying lines differ, and the
+        # reported book must supply the reported line.
+        books_used = M.argmax(axis=0)
+        best_odds = M.max(axis=0)
+
+        arb_opp = self.basic_arbitrage(best_odds.tolist(), stake)
+        if arb_opp:
+            arb_opp['books_used'] = books_used.tolist()
+            arb_opp['combined_odds'] = best_odds.tolist()
+        return arb_opp
 
     def surebet_scanner(self, odds_list, min_roi=0.01):
         """
@@ -190,16 +225,46 @@ class ArbitrageCalculator:
         Returns:
             list: Profitable arbitrage opportunities
         """
+        # Only 2- and 3-way markets are scannable, same as basic_arbitrage's
+        # validation on the scalar path; anything else is silently skipped.
+        valid = [i for i, odds_set in enumerate(odds_list) if len(odds_set) in (2, 3)]
+        if not valid:
+            return []
+
+        # Stack every market into one (N, K) matrix — 2-way rows padded with
+        # inf, whose implied probability is 0 — and score them all in a
+        # handful of ufunc passes instead of re-entering basic_arbitrage per row.
+        k = max(len(odds_list[i]) for i in valid)
+        M = np.full((len(valid), k), np.inf)
+        for row, i in enumerate(valid):
+            odds_set = odds_list[i]
+            M[row, :len(odds_set)] = [
+                x if type(x) is float else self.odds_converter.decimal_odds(x)
+                for x in odds_set
+            ]
+
+        probs = np.round(1.0 / M, 3)
+        arb = probs.sum(axis=1)
+        # Standard $100 stake for comparison; ROI % equals the profit then.
+        profit = 100.0 / arb - 100.0
+        hits = np.nonzero((arb < 1.0) & (profit >= min_roi))[0]
+        hits = hits[np.argsort(-profit[hits])]  # ROI descending
+
         opportunities = []
-        
-        for odds_set in odds_list:
-            # Test with standard $100 stake for comparison
-            arb_opp = self.basic_arbitrage(odds_set, 100)
-            if arb_opp and arb_opp['roi'] >= min_roi:
-                opportunities.append(arb_opp)
-                
-        # Sort by ROI descending
-        opportunities.sort(key=lambda x: x['roi'], reverse=True)
+        for i in hits:
+            m = len(odds_list[valid[i]])
+            row = probs[i, :m]
+            stakes = np.round(row * 100.0 / arb[i], 2)
+            opportunities.append({
+                'profit': round(float(profit[i]), 2),
+                'stakes': stakes.tolist(),
+                'total_stake': 100,
+                'arb_percent': round(float(arb[i]), 4),
+                'vig': 0,
+                'market_type': '3-way' if m == 3 else '2-way',
+                'probabilities': np.round(row, 4).tolist(),
+                'roi': round(float(profit[i]), 2)
+            })
         return opportunities
 
 # For backward compatibility
@@ -1,6 +1,30 @@
+import logging
 import numpy as np
 import pandas as pd
 from WagerBrain import ProbabilityCalculator, OddsConverter
+from WagerBrain._kernels import _kelly_outcomes
+
+_LOG = logging.getLogger("WagerBrain")
+
+
+def _spread_outcome_probs(diff, mask):
+    """Tally away/draw/home outcomes for the masked games in one pass.
+
+    np.sign(diff) + 1 maps losses/draws/wins to 0/1/2, so one bincount
+    replaces three separate boolean-mask scans over the score columns.
+    """
+    total_games = int(np.count_nonzero(mask))
+    if total_games == 0:
+        return None
+
+    counts = np.bincount(np.sign(diff[mask]).astype(np.int8) + 1, minlength=3)
+    return {
+        'home_win': int(counts[2]) / total_games,
+        'draw': int(counts[1]) / total_games,
+        'away_win': int(counts[0]) / total_games,
+        'total_games': total_games
+    }
+
 
 class ValueBetFinder:
     """
@@ -29,22 +53,23 @@ class ValueBetFinder:
             total_matches = len(df)
             if total_matches == 0:
                 return None
-                
-            home_wins = len(df[df[home_col] > df[away_col]])
-            draws = len(df[df[home_col] == df[away_col]])
-            away_wins = len(df[df[home_col] < df[away_col]])
-            
+
+            # One subtraction + bincount instead of three mask scans, each of
+            # which materialized a filtered frame just to take its length.
+            diff = df[home_col].to_numpy() - df[away_col].to_numpy()
+            counts = np.bincount(np.sign(diff).astype(np.int8) + 1, minlength=3)
+
             return {
-                'home_win': home_wins / total_matches,
-                'draw': draws / total_matches,
-                'away_win': away_wins / total_matches
+                'home_win': int(counts[2]) / total_matches,
+                'draw': int(counts[1]) / total_matches,
+                'away_win': int(counts[0]) / total_matches
             }
-            
+
         except Exception as e:
-            print(f"Error calculating true probabilities: {e}")
+            _LOG.error("Error calculating true probabilities: %s", e)
             return None
 
-    def value_bet_3way(self, true_probs, market_odds, min_edge=0.02):
+    def value_bet_3way(self, true_probs, market_odds, min_edge=0.02, market_probs=None):
         """
         Identify value bets in 3-way markets.
 
@@ -52,40 +77,41 @@ class ValueBetFinder:
             true_probs: Dictionary of true probabilities {'home_win': x, 'draw': y, 'away_win': z}
             market_odds: List of market odds [home_odds, draw_odds, away_odds]
             min_edge: Minimum required edge to consider a value bet
+            market_probs: Optional precomputed implied probabilities; skips
+                re-deriving them when the caller already has them.
 
         Returns:
             dict: Value bet opportunities
         """
+        if len(market_odds) != 3:
+            raise ValueError("market_odds must list 3 outcomes [home, draw, away]")
+
         value_bets = {}
-        
-        try:
-            # Calculate implied probabilities from market odds
+
+        # Calculate implied probabilities from market odds
+        if market_probs is None:
             market_probs = [
                 self.prob_calc.decimal_implied_win_prob(market_odds[0]),
                 self.prob_calc.decimal_implied_win_prob(market_odds[1]),
                 self.prob_calc.decimal_implied_win_prob(market_odds[2])
             ]
-            
-            # Compare true probabilities with market probabilities
-            outcomes = ['home_win', 'draw', 'away_win']
-            true_prob_list = [true_probs['home_win'], true_probs['draw'], true_probs['away_win']]
-            
-            for i, (true_prob, market_prob) in enumerate(zip(true_prob_list, market_probs)):
-                edge = true_prob - market_prob
-                if edge >= min_edge:
-                    value_bets[outcomes[i]] = {
-                        'true_probability': round(true_prob, 4),
-                        'market_probability': round(market_prob, 4),
-                        'edge': round(edge, 4),
-                        'odds': market_odds[i],
-                        'expected_value': round((true_prob * (market_odds[i] - 1)) - (1 - true_prob), 4)
-                    }
-                    
-            return value_bets
-            
-        except Exception as e:
-            print(f"Error in value_bet_3way: {e}")
-            return {}
+
+        # Compare true probabilities with market probabilities
+        outcomes = ['home_win', 'draw', 'away_win']
+        true_prob_list = [true_probs['home_win'], true_probs['draw'], true_probs['away_win']]
+
+        for i, (true_prob, market_prob) in enumerate(zip(true_prob_list, market_probs)):
+            edge = true_prob - market_prob
+            if edge >= min_edge:
+                value_bets[outcomes[i]] = {
+                    'true_probability': round(true_prob, 4),
+                    'market_probability': round(market_prob, 4),
+                    'edge': round(edge, 4),
+                    'odds': market_odds[i],
+                    'expected_value': round((true_prob * (market_odds[i] - 1)) - (1 - true_prob), 4)
+                }
+
+        return value_bets
 
     def kelly_3way(self, true_probs, market_odds, bankroll):
         """
@@ -99,41 +125,35 @@ class ValueBetFinder:
         Returns:
             dict: Kelly-optimal stakes for each outcome
         """
+        if len(market_odds) != 3:
+            raise ValueError("market_odds must list 3 outcomes [home, draw, away]")
+
         kelly_stakes = {}
-        
-        try:
-            outcomes = ['home_win', 'draw', 'away_win']
-            true_prob_list = [true_probs['home_win'], true_probs['draw'], true_probs['away_win']]
-            
-            for i, (true_prob, odds) in enumerate(zip(true_prob_list, market_odds)):
-                # Kelly Criterion for binary outcomes (we bet on one outcome at a time)
-                # For 3-way, we calculate Kelly for each outcome independently
-                b = odds - 1  # decimal odds profit
-                p = true_prob
-                q = 1 - true_prob
-                
-                kelly_fraction = (b * p - q) / b
-                
-                # Only bet positive edges
-                if kelly_fraction > 0:
-                    stake = bankroll * kelly_fraction
-                    kelly_stakes[outcomes[i]] = {
-                        'stake': round(stake, 2),
-                        'kelly_fraction': round(kelly_fraction, 4),
-                        'edge': round((b * p - q), 4)
-                    }
-                else:
-                    kelly_stakes[outcomes[i]] = {
-                        'stake': 0,
-                        'kelly_fraction': 0,
-                        'edge': round((b * p - q), 4)
-                    }
-                    
-            return kelly_stakes
-            
-        except Exception as e:
-            print(f"Error calculating Kelly stakes: {e}")
-            return {}
+        outcomes = ['home_win', 'draw', 'away_win']
+        true_prob_list = [true_probs['home_win'], true_probs['draw'], true_probs['away_win']]
+
+        # Kelly Criterion for binary outcomes (we bet on one outcome at a time)
+        # For 3-way, we calculate Kelly for each outcome independently; the
+        # arithmetic runs in the compiled kernel, only dict assembly stays here.
+        p = np.asarray(true_prob_list, dtype=np.float64)
+        o = np.asarray(market_odds, dtype=np.float64)
+        stakes, fractions, edges = _kelly_outcomes(p, o, float(bankroll))
+
+        for i, outcome in enumerate(outcomes):
+            if fractions[i] > 0:
+                kelly_stakes[outcome] = {
+                    'stake': round(float(stakes[i]), 2),
+                    'kelly_fraction': round(float(fractions[i]), 4),
+                    'edge': round(float(edges[i]), 4)
+                }
+            else:
+                kelly_stakes[outcome] = {
+                    'stake': 0,
+                    'kelly_fraction': 0,
+                    'edge': round(float(edges[i]), 4)
+                }
+
+        return kelly_stakes
 
     def spread_home_dog_to_fav(self, df):
         """
@@ -142,35 +162,15 @@ class ValueBetFinder:
         """
         try:
             # How Often Does the Home Team Win When They Move From Dog to Fav
-            idx = np.where((df['Home Spread Close'] < 0) & (df['Home Score'] > df['Away Score']))
-            home_flip_spread_win = df.loc[idx]
-
-            idc = np.where((df['Home Spread Close'] < 0))
-            home_flip_spread_total = df.loc[idc]
+            hs = df['Home Spread Close'].to_numpy()
+            diff = df['Home Score'].to_numpy() - df['Away Score'].to_numpy()
+            return _spread_outcome_probs(diff, hs < 0)
 
-            if len(home_flip_spread_total) == 0:
-                return None
-                
-            home_win_prob = len(home_flip_spread_win) / len(home_flip_spread_total)
-            
-            # For 3-way context, we might want draw and away win probabilities too
-            draws = len(df[(df['Home Spread Close'] < 0) & (df['Home Score'] == df['Away Score'])])
-            away_wins = len(df[(df['Home Spread Close'] < 0) & (df['Home Score'] < df['Away Score'])])
-            
-            total_games = len(home_flip_spread_total)
-            
-            return {
-                'home_win': home_win_prob,
-                'draw': draws / total_games,
-                'away_win': away_wins / total_games,
-                'total_games': total_games
-            }
-            
         except KeyError as e:
-            print(f"Missing required column in DataFrame: {e}")
+            _LOG.error("Missing required column in DataFrame: %s", e)
             return None
         except Exception as e:
-            print(f"Error in spread_home_dog_to_fav: {e}")
+            _LOG.error("Error in spread_home_dog_to_fav: %s", e)
             return None
 
     def spread_home_fav_to_dog(self, df):
@@ -180,35 +180,15 @@ class ValueBetFinder:
         """
         try:
             # How Often Does the Home Team Win When They Move From Fav to Dog
-            idx = np.where((df['Home Spread Close'] >= 0) & (df['Home Score'] > df['Away Score']))
-            home_flip_spread_win = df.loc[idx]
+            hs = df['Home Spread Close'].to_numpy()
+            diff = df['Home Score'].to_numpy() - df['Away Score'].to_numpy()
+            return _spread_outcome_probs(diff, hs >= 0)
 
-            idc = np.where((df['Home Spread Close'] >= 0))
-            home_flip_spread_total = df.loc[idc]
-
-            if len(home_flip_spread_total) == 0:
-                return None
-                
-            home_win_prob = len(home_flip_spread_win) / len(home_flip_spread_total)
-            
-            # Calculate all outcome probabilities for 3-way context
-            draws = len(df[(df['Home Spread Close'] >= 0) & (df['Home Score'] == df['Away Score'])])
-            away_wins = len(df[(df['Home Spread Close'] >= 0) & (df['Home Score'] < df['Away Score'])])
-            
-            total_games = len(home_flip_spread_total)
-            
-            return {
-                'home_win': home_win_prob,
-                'draw': draws / total_games,
-                'away_win': away_wins / total_games,
-                'total_games': total_games
-            }
-            
         except KeyError as e:
-            print(f"Missing required column in DataFrame: {e}")
+            _LOG.error("Missing required column in DataFrame: %s", e)
             return None
         except Exception as e:
-            print(f"Error in spread_home_fav_to_dog: {e}")
+            _LOG.error("Error in spread_home_fav_to_dog: %s", e)
             return None
 
     def comprehensive_value_analysis(self, df, current_odds_3way, bankroll, min_edge=0.02):
@@ -231,10 +211,16 @@ class ValueBetFinder:
             true_probs = self.calculate_true_probabilities_3way(df)
             if not true_probs:
                 return analysis
-            
+
+            # One implied-probability pass over the market, reused by the
+            # value-bet scan and both market_analysis figures below; rounded
+            # to 3dp to match decimal_implied_win_prob.
+            market_probs = np.round(np.reciprocal(np.asarray(current_odds_3way, dtype=np.float64)), 3)
+
             # Find value bets
-            value_bets = self.value_bet_3way(true_probs, current_odds_3way, min_edge)
-            
+            value_bets = self.value_bet_3way(true_probs, current_odds_3way, min_edge,
+                                             market_probs=market_probs.tolist())
+
             # Calculate Kelly stakes
             kelly_stakes = self.kelly_3way(true_probs, current_odds_3way, bankroll)
             
@@ -244,7 +230,7 @@ class ValueBetFinder:
             
             analysis = {
                 'true_probabilities': {k: round(v, 4) for k, v in true_probs.items()},
-                'market_probabilities': [round(self.prob_calc.decimal_implied_win_prob(odd), 4) for odd in current_odds_3way],
+                'market_probabilities': market_probs.round(4).tolist(),
                 'value_bets': value_bets,
                 'kelly_stakes': kelly_stakes,
                 'specialized_strategies': {
@@ -252,7 +238,7 @@ class ValueBetFinder:
                     'home_fav_to_dog': fav_to_dog_probs
                 },
                 'market_analysis': {
-                    'total_vig': round(sum([self.prob_calc.decimal_implied_win_prob(odd) for odd in current_odds_3way]) - 1, 4),
+                    'total_vig': round(float(market_probs.sum()) - 1, 4),
                     'fair_odds': [round(1/prob, 2) for prob in true_probs.values()]
                 }
             }
@@ -260,7 +246,7 @@ class ValueBetFinder:
             return analysis
             
         except Exception as e:
-            print(f"Error in comprehensive_value_analysis: {e}")
+            _LOG.error("Error in comprehensive_value_analysis: %s", e)
             return {}
 
 # For backward compatibility
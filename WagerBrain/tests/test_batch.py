@@ -0,0 +1,63 @@
+import numpy as np
+from WagerBrain.brain import BnkRllBrn
+from WagerBrain.probs import ProbabilityCalculator
+from WagerBrain.payouts import PayoutCalculator
+
+P = np.array([0.55, 0.40, 0.62])
+ODDS = np.array([2.0, 1.8, 2.4])  # decimal format — float64 arrays are read as decimal
+
+
+def test_ev_kelly_batch_matches_scalar():
+    brain = BnkRllBrn(1000, log_file=None)
+    batch = brain.ev_kelly_batch(P, ODDS)
+    for i in range(len(P)):
+        wager = brain.ev_kelly(float(P[i]), float(ODDS[i]))
+        assert abs(batch["ev"][i] - wager.ev) < 1e-9
+        assert abs(batch["pct"][i] - wager.pct_bank) < 1e-9
+        assert abs(batch["amount"][i] - float(wager.amount)) < 1e-9
+
+
+def test_pure_kelly_batch_matches_scalar():
+    brain = BnkRllBrn(1000, log_file=None)
+    batch = brain.pure_kelly_batch(P, ODDS)
+    for i in range(len(P)):
+        wager = brain.pure_kelly(float(P[i]), float(ODDS[i]))
+        assert abs(batch["ev"][i] - wager.ev) < 1e-9
+        assert abs(batch["pct"][i] - wager.pct_bank) < 1e-9
+        assert abs(batch["amount"][i] - float(wager.amount)) < 1e-9
+
+
+def test_simulate_bets_routes_to_batch():
+    brain = BnkRllBrn(1000, log_file=None)
+    via_router = brain.simulate_bets("pure_kelly", p=P, o=ODDS)
+    direct = brain.pure_kelly_batch(P, ODDS)
+    for key in ("amount", "pct", "ev", "kelly_f"):
+        assert np.array_equal(via_router[key], direct[key])
+
+
+def test_implied_prob_batches_match_scalar():
+    pc = ProbabilityCalculator()
+    dec_batch = pc.decimal_implied_win_prob_batch(ODDS)
+    amer = [-110, 150, 200]
+    amer_batch = pc.american_implied_win_prob_batch(amer)
+    for i in range(len(ODDS)):
+        assert dec_batch[i] == pc.decimal_implied_win_prob(float(ODDS[i]))
+        assert amer_batch[i] == pc.american_implied_win_prob(amer[i])
+
+
+def test_win_prob_to_odds_array_matches_scalar():
+    pc = ProbabilityCalculator()
+    probs = np.array([0.3, 0.5, 0.65])
+    dec = pc.win_prob_to_odds_array(probs, "d")
+    amer = pc.win_prob_to_odds_array(probs, "a")
+    for i in range(len(probs)):
+        assert dec[i] == pc.win_prob_to_odds(float(probs[i]), "d")
+        assert amer[i] == pc.win_prob_to_odds(float(probs[i]), "a")
+
+
+def test_parlay_payout_and_profit():
+    pc = PayoutCalculator()
+    payout, profit = pc.parlay_payout_and_profit([2.5, 1.5], 100)
+    assert payout == pc.parlay_payout([2.5, 1.5], 100)
+    assert profit == pc.parlay_profit([2.5, 1.5], 100)
+    assert (payout, profit) == (375.0, 275.0)
@@ -4,8 +4,30 @@ from logging import Logger
 from threading import Thread, RLock, Condition
 from pathlib import Path
 from contextlib import contextmanager
-from queue import SimpleQueue
+from queue import SimpleQueue, Empty
+from functools import lru_cache
 import json
+import numpy as np
+
+_LOG = logging.getLogger("WagerBrain")
+
+
+@lru_cache(maxsize=4096)
+def _be(stake: float, payout: float) -> float:
+    """Memoized break-even ratio; book lines draw from a small ladder."""
+    return stake / payout
+
+
+try:  # Optional accelerator — stdlib json fallback keeps orjson soft
+    import orjson
+
+    def _dumps(data) -> bytes:
+        """Serialize one log record to JSON bytes."""
+        return orjson.dumps(data, default=str)
+except ImportError:  # pragma: no cover
+    def _dumps(data) -> bytes:
+        """Serialize one log record to JSON bytes."""
+        return json.dumps(data, default=str).encode()
 
 class MarketUtils:
     """
@@ -30,7 +52,7 @@ class MarketUtils:
         Returns:
             float: Required win percentage to break even (>100% if bookmaker edge exists).
         """
-        return stake / payout
+        return _be(stake, payout)
 
     @staticmethod
     def vig(f_stake: float, f_payout: float, u_stake: float, u_payout: float) -> float:
@@ -46,7 +68,7 @@ class MarketUtils:
         Returns:
             float: Bookmaker edge (% of wager paid to bookmaker).
         """
-        return (MarketUtils.break_even_pct(f_stake, f_payout) + MarketUtils.break_even_pct(u_stake, u_payout)) - 1
+        return _be(f_stake, f_payout) + _be(u_stake, u_payout) - 1
 
     def bookmaker_margin(self, fav_odds, dog_odds, draw_odds=None) -> float:  # REMOVED @staticmethod
         """
@@ -82,32 +104,45 @@ class MarketUtils:
         Returns:
             float: Edge to bookmaker/exchange after commission adjustment.
         """
-        fav_dec = 1 + ((1 - (commish / 100)) * (self.odds_converter.decimal_odds(fav_odds) - 1))  # FIXED: Use self.odds_converter
-        dog_dec = 1 + ((1 - (commish / 100)) * (self.odds_converter.decimal_odds(dog_odds) - 1))  # FIXED: Use self.odds_converter
+        outcomes = [fav_odds, dog_odds] if draw_odds is None else [fav_odds, dog_odds, draw_odds]
+        dec = np.asarray([self.odds_converter.decimal_odds(o) for o in outcomes], dtype=np.float64)
 
-        if draw_odds is None:
-            return ((1 / fav_dec * 100 + 1 / dog_dec * 100) - 100) / 100
-        else:
-            draw_dec = 1 + ((1 - (commish / 100)) * (self.odds_converter.decimal_odds(draw_odds) - 1))  # FIXED: Use self.odds_converter
-            return ((1 / fav_dec * 100 + 1 / dog_dec * 100 + 1 / draw_dec * 100) - 100) / 100
+        # Commission adjustment and reciprocal sum in one broadcast pass
+        # instead of a duplicated per-outcome formula.
+        adj = 1.0 + (1.0 - commish / 100.0) * (dec - 1.0)
+        return float((1.0 / adj).sum()) - 1.0
 
 # ————————————————————————————————
 # 1. BULLETPROOF LOGGING
 # ————————————————————————————————
+# Known level names resolved ahead of time — one dict probe instead of a
+# getattr on the logging module, and unknown names fall back to INFO.
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 def setup_logger(level: str = "INFO") -> Logger:
     """
     Configure the root logger with clean, colored, timestamped output.
     Levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
     """
     logger = logging.getLogger("WagerBrain")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_LEVELS.get(level.upper(), logging.INFO))
+    if logger.handlers:
+        # Already configured — don't rebuild (or orphan mid-flush) handlers.
+        return logger
     handler = logging.StreamHandler()
     formatter = logging.Formatter(
         "%(asctime)s | %(levelname)-8s | %(message)s",
         "%H:%M:%S"
     )
     handler.setFormatter(formatter)
-    logger.handlers = [handler]
+    logger.addHandler(handler)
     return logger
 
 
@@ -132,21 +167,41 @@ class GlobalLogWriter:
     @contextmanager
     def _safe_write(self):
         try:
-            with open(self.path, "a") as f:
+            with open(self.path, "ab") as f:
                 yield f
         except Exception as e:
-            logging.getLogger("WagerBrain").error(f"LOG WRITE FAILED: {e}")
+            _LOG.error(f"LOG WRITE FAILED: {e}")
+
+    def _flush_buf(self, buf: bytearray) -> None:
+        with self._safe_write() as f:
+            f.write(bytes(buf))
 
     def _run(self) -> None:
+        # Block for the first record, then drain whatever else has queued up
+        # and hit the disk once per batch — bursts cost one open() instead
+        # of one per message.
         while True:
             data = self.queue.get()
-            if data is None: break
-            try:
-                with self._safe_write() as f:
-                    json.dump(data, f)
-                    f.write("\n")
-            except Exception:
-                pass
+            stop = data is None
+            buf = bytearray()
+            while not stop:
+                try:
+                    buf += _dumps(data)
+                    buf += b"\n"
+                except Exception:
+                    pass
+                try:
+                    data = self.queue.get_nowait()
+                except Empty:
+                    break
+                stop = data is None
+            if buf:
+                try:
+                    self._flush_buf(buf)
+                except Exception:
+                    pass
+            if stop:
+                return
 
     def write(self, data): self.queue.put(data)
     def stop(self):
@@ -1,19 +1,34 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from decimal import Decimal, getcontext
 from typing import Union, Dict, Callable, Optional, Literal
 from contextlib import contextmanager
 from pathlib import Path
-from collections import deque
+from queue import Queue
 from threading import Thread, RLock, Condition
 import atexit
 from datetime import datetime
 import json
+import logging
+import numpy as np
+
+_LOG = logging.getLogger("WagerBrain")
+
+try:  # Optional accelerator — stdlib json fallback keeps orjson soft
+    import orjson
+
+    def _dumps(data) -> bytes:
+        """Serialize one wager record to JSON bytes."""
+        return orjson.dumps(data, default=str)
+except ImportError:  # pragma: no cover
+    def _dumps(data) -> bytes:
+        """Serialize one wager record to JSON bytes."""
+        return json.dumps(data, default=str).encode()
 
 
 # ————————————————————————————————
 # 3. WAGER — IMMUTABLE RECORD
 # ————————————————————————————————
-@dataclass(frozen=True)  # Immutable
+@dataclass(frozen=True, slots=True)  # Immutable, no per-instance __dict__
 class Wager:
     """Immutable, serializable record of a single bet."""
     strategy: str
@@ -24,21 +39,40 @@ class Wager:
     ev: float  # Expected value (unit)
     kelly_f: float  # Kelly fraction/weight
     odds: Optional[Union[str, int, float, list]] = None  # Odds (single or list for parlay/margin)
+    dec_odds: float = 0.0  # Decimal odds cached at record time (0 = unknown)
     win_rate: Optional[float] = None  # Estimated p (win prob)
     bookie: str = "Generic"  # Default; override for specific
     timestamp: str = ""
     outcome: Optional[str] = None  # Post-bet: "win", "loss", "push"
-    
+    # JSON-ready view built once at construction; the record is frozen, so
+    # flush/log paths never need to re-walk the fields.
+    _cached_dict: Optional[dict] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         if self.timestamp == "":
             object.__setattr__(self, 'timestamp', datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    
+        object.__setattr__(self, '_cached_dict', {
+            "strategy": self.strategy,
+            "amount": str(self.amount),
+            "why": self.why,
+            "risk": self.risk,
+            "pct_bank": self.pct_bank,
+            "ev": self.ev,
+            "kelly_f": self.kelly_f,
+            "odds": self.odds,
+            "dec_odds": self.dec_odds,
+            "win_rate": self.win_rate,
+            "bookie": self.bookie,
+            "timestamp": self.timestamp,
+            "outcome": self.outcome,
+        })
+
     def dict(self) -> dict:
-        d = asdict(self)
-        # Str-ify Decimals for JSON
-        if 'amount' in d:
-            d['amount'] = str(d['amount'])
-        return d
+        return self._cached_dict
+
+    def to_json_dict(self) -> dict:
+        """JSON-ready dict; amount is the only Decimal, stringified."""
+        return self._cached_dict
 
 # ————————————————————————————————
 # 4. HISTORY BUFFER — AUTO-FLUSH + I/O GUARD
@@ -52,12 +86,62 @@ class HistoryBuffer:
     - atexit flush
     """
     def __init__(self, max_size: int = 10_000, flush_file: Optional[Path] = None):
-        self.buffer = deque(maxlen=max_size)
+        # Preallocated ring with an integer write cursor: no deque node
+        # overhead, and a full buffer hands the whole list to the flush
+        # thread instead of copying 10k references.
+        self._ring = [None] * max_size
+        self.max_size = max_size
         self.flush_file = flush_file
         self.lock = RLock()
+        # Structure-of-arrays mirror of the numeric Wager fields so that
+        # aggregation passes (summary totals, ROI) run as contiguous float
+        # reductions instead of touching thousands of Python objects.
+        self._amt = np.zeros(max_size)
+        self._ev = np.zeros(max_size)
+        self._pct = np.zeros(max_size)
+        self._n = 0
+        # Full-buffer flushes run on a background thread so append() never
+        # waits on disk; flush() drains pending batches synchronously.
+        self._flush_q: Optional[Queue] = None
         if flush_file:
+            self._flush_q = Queue()
+            Thread(target=self._flush_worker, daemon=True).start()
             atexit.register(self.flush)
 
+    def _col(self, arr: np.ndarray) -> np.ndarray:
+        """Valid region of a column array, oldest to newest."""
+        if self._n <= self.max_size:
+            return arr[:self._n]
+        i = self._n % self.max_size
+        return np.concatenate((arr[i:], arr[:i]))
+
+    def _records(self) -> list:
+        """Live wagers, oldest to newest."""
+        if self._n <= self.max_size:
+            return self._ring[:self._n]
+        i = self._n % self.max_size
+        return self._ring[i:] + self._ring[:i]
+
+    @property
+    def buffer(self) -> list:
+        """Currently buffered wagers, oldest to newest."""
+        return self._records()
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Wager amounts (dollars) for the currently buffered bets."""
+        return self._col(self._amt)
+
+    @property
+    def evs(self) -> np.ndarray:
+        """Expected values for the currently buffered bets."""
+        return self._col(self._ev)
+
+    @property
+    def pcts(self) -> np.ndarray:
+        """Percent-of-bank values for the currently buffered bets."""
+        return self._col(self._pct)
+
     @contextmanager
     def _safe_open(self, mode: str = "a"):
         """Context manager with full I/O error handling."""
@@ -65,37 +149,62 @@ class HistoryBuffer:
             with open(self.flush_file, mode) as f:
                 yield f
         except PermissionError:
-            logging.getLogger("WagerBrain").error("PERMISSION DENIED: Cannot write to log file")
+            _LOG.error("PERMISSION DENIED: Cannot write to log file")
             raise
         except OSError as e:
-            logging.getLogger("WagerBrain").error(f"DISK ERROR: {e}")
+            _LOG.error(f"DISK ERROR: {e}")
             raise
         except Exception as e:
-            logging.getLogger("WagerBrain").error(f"UNEXPECTED I/O ERROR: {e}")
+            _LOG.error(f"UNEXPECTED I/O ERROR: {e}")
             raise
 
     def append(self, wager: Wager) -> None:
         with self.lock:
-            self.buffer.append(wager)
-            if len(self.buffer) == self.buffer.maxlen and self.flush_file:
-                self._flush()
+            i = self._n % self.max_size
+            self._ring[i] = wager
+            self._amt[i] = float(wager.amount)
+            self._ev[i] = wager.ev
+            self._pct[i] = wager.pct_bank
+            self._n += 1
+            if self._n == self.max_size and self.flush_file:
+                self._flush_q.put(self._ring)
+                self._ring = [None] * self.max_size
+                self._n = 0
 
     def _flush(self) -> None:
         if not self.flush_file:
             return
         try:
-            with self._safe_open() as f:
-                for w in list(self.buffer):
-                    json.dump(w.dict(), f)
-                    f.write("\n")
-            self.buffer.clear()
-            logging.getLogger("WagerBrain").debug("History flushed to disk")
+            # Serialize everything first, then issue one write: a full buffer
+            # is 10k records, and per-record dump/newline pairs doubled the
+            # syscall count for no benefit.
+            lines = [_dumps(w.dict()) for w in self._records()]
+            if lines:
+                with self._safe_open("ab") as f:
+                    f.write(b"\n".join(lines) + b"\n")
+            self._ring = [None] * self.max_size
+            self._n = 0
+            _LOG.debug("History flushed to disk")
         except Exception:
             pass  # Already logged in _safe_open
 
+    def _flush_worker(self) -> None:
+        while True:
+            batch = self._flush_q.get()
+            try:
+                with self._safe_open("ab") as f:
+                    f.writelines(_dumps(w.dict()) + b"\n" for w in batch)
+            except Exception:
+                pass  # Already logged in _safe_open
+            finally:
+                self._flush_q.task_done()
+
     def flush(self) -> None:
+        """Synchronous flush: wait out background batches, then write the rest."""
+        if self._flush_q is not None:
+            self._flush_q.join()
         self._flush()
 
-    def __len__(self) -> int: return len(self.buffer)
-    def __iter__(self): return iter(self.buffer)
+    def __len__(self) -> int: return min(self._n, self.max_size)
+    def __iter__(self): return iter(self._records())
 